@@ -0,0 +1,80 @@
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Benchmark against a throwaway database, never the real one
+os.environ['BOOK_TRACKER_DB'] = os.path.join(tempfile.mkdtemp(), 'bench.db')
+
+from db.models import Book, configure_async, initialize_database
+
+BOOKS = 20000
+LOOKUPS = 20000
+CONCURRENCY = 64
+
+
+def make_books(prefix, count):
+    return [Book(f"{prefix} {i}", f"Author {i % 500}", "Bench", "want_to_read")
+            for i in range(count)]
+
+
+def report(label, count, seconds):
+    print(f"  {label:<28} {count / seconds:>10,.0f} ops/s  ({seconds:.2f}s)")
+
+
+def bench_sync(ids):
+    start = time.perf_counter()
+    Book.save_many(make_books("Sync", BOOKS))
+    report("save_many", BOOKS, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for book_id in ids:
+        Book.find_by_id(book_id)
+    report("find_by_id", len(ids), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    count = sum(1 for _ in Book.iter_all())
+    report("iter_all", count, time.perf_counter() - start)
+
+
+async def bench_async(ids):
+    start = time.perf_counter()
+    await Book.asave_many(make_books("Async", BOOKS))
+    report("asave_many", BOOKS, time.perf_counter() - start)
+
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def lookup(book_id):
+        async with semaphore:
+            return await Book.afind_by_id(book_id)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(lookup(book_id) for book_id in ids))
+    report(f"afind_by_id (x{CONCURRENCY} concurrent)", len(ids), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    count = 0
+    async for _ in Book.aiter_all():
+        count += 1
+    report("aiter_all", count, time.perf_counter() - start)
+
+
+def main():
+    readers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 4
+    initialize_database()
+    Book.save_many(make_books("Seed", BOOKS))
+    ids = [random.randint(1, BOOKS) for _ in range(LOOKUPS)]
+
+    print(f"Sync API ({os.environ['BOOK_TRACKER_DB']})")
+    bench_sync(ids)
+
+    print(f"Async API ({readers} reader threads)")
+    executor = configure_async(max_readers=readers)
+    asyncio.run(bench_async(ids))
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
+import datetime
+
 from helpers import (
     display_main_menu, display_books, display_reviews,
     get_valid_rating, get_valid_book_id, get_valid_review_id, get_book_status
 )
 from db.models import Book, Review, initialize_database
+from review_analytics import display_analytics
+from reports import get_year_report
 
 def add_new_book():
     print("\n➕ ADD NEW BOOK")
@@ -18,31 +22,27 @@ def add_new_book():
     except ValueError as e:
         print(f"❌ Error: {e}")
 
-def view_all_books():
-    books = Book.get_all()
-    display_books(books, "ALL BOOKS")
+def view_all_books(use_pager=False):
+    display_books(Book.listing_rows(), "ALL BOOKS", use_pager)
 
 def find_book_by_id():
     try:
         book_id = get_valid_book_id()
         book = Book.find_by_id(book_id)
         if book:
-            display_books([book], f"BOOK #{book.id}")
+            display_books(Book.listing_rows(book_id=book.id), f"BOOK #{book.id}")
             # Show reviews for this book
-            reviews = book.reviews()
-            display_reviews(reviews, f"REVIEWS FOR '{book.title}'")
+            display_reviews(Review.listing_rows(book_id=book.id), f"REVIEWS FOR '{book.title}'")
     except ValueError as e:
         print(f"❌ Error: {e}")
 
 def find_books_by_title():
     title = input("Enter title search term: ").strip()
-    books = Book.find_by_title(title)
-    display_books(books, f"BOOKS WITH '{title}' IN TITLE")
+    display_books(Book.listing_rows(title=title), f"BOOKS WITH '{title}' IN TITLE")
 
 def find_books_by_author():
     author = input("Enter author search term: ").strip()
-    books = Book.find_by_author(author)
-    display_books(books, f"BOOKS BY '{author}'")
+    display_books(Book.listing_rows(author=author), f"BOOKS BY '{author}'")
 
 def update_book_status():
     view_all_books()
@@ -98,9 +98,8 @@ def add_review_to_book():
     except ValueError as e:
         print(f"❌ Error: {e}")
 
-def view_all_reviews():
-    reviews = Review.get_all()
-    display_reviews(reviews, "ALL REVIEWS")
+def view_all_reviews(use_pager=False):
+    display_reviews(Review.listing_rows(), "ALL REVIEWS", use_pager)
 
 def find_reviews_by_book():
     view_all_books()
@@ -109,8 +108,7 @@ def find_reviews_by_book():
         book = Book.find_by_id(book_id)
         
         if book:
-            reviews = Review.find_by_book_id(book_id)
-            display_reviews(reviews, f"REVIEWS FOR '{book.title}'")
+            display_reviews(Review.listing_rows(book_id=book_id), f"REVIEWS FOR '{book.title}'")
         else:
             print("Book not found.")
     except ValueError as e:
@@ -119,8 +117,7 @@ def find_reviews_by_book():
 def find_reviews_by_rating():
     try:
         rating = get_valid_rating()
-        reviews = Review.find_by_rating(rating)
-        display_reviews(reviews, f"REVIEWS WITH {rating} STARS")
+        display_reviews(Review.listing_rows(rating=rating), f"REVIEWS WITH {rating} STARS")
     except ValueError as e:
         print(f"❌ Error: {e}")
 
@@ -131,7 +128,7 @@ def delete_review():
         review = Review.find_by_id(review_id)
         
         if review:
-            book = Book.find_by_id(review.book_id)
+            book = Book.only('title').find_by_id(review.book_id)
             book_title = book.title if book else "Unknown Book"
             confirm = input(f"Are you sure you want to delete this review for '{book_title}'? (y/n): ").strip().lower()
             if confirm == 'y':
@@ -145,7 +142,7 @@ def delete_review():
         print(f"❌ Error: {e}")
 
 def view_reading_statistics():
-    books = Book.get_all()
+    books = Book.only('status').get_all()
     if not books:
         print("No books in your collection yet.")
         return
@@ -155,7 +152,7 @@ def view_reading_statistics():
     reading = len([b for b in books if b.status == 'reading'])
     want_to_read = len([b for b in books if b.status == 'want_to_read'])
     
-    all_reviews = Review.get_all()
+    all_reviews = Review.only('rating', 'book_id').get_all()
     avg_rating = sum(review.rating for review in all_reviews) / len(all_reviews) if all_reviews else None
     
     print("\n📊 READING STATISTICS")
@@ -176,12 +173,32 @@ def view_reading_statistics():
         
         if book_review_counts:
             max_reviews = max(book_review_counts.values())
-            most_reviewed_books = [Book.find_by_id(book_id) for book_id, count in book_review_counts.items() if count == max_reviews]
+            most_reviewed_books = [Book.only('title').find_by_id(book_id) for book_id, count in book_review_counts.items() if count == max_reviews]
             print(f"\nMost reviewed book(s) ({max_reviews} reviews):")
             for book in most_reviewed_books:
                 if book:
                     print(f"  - {book.title}")
 
+def view_review_analytics():
+    rebuild = input("Rebuild summaries from scratch? (y/N): ").strip().lower() == 'y'
+    display_analytics(full=rebuild)
+
+def view_year_report():
+    this_year = datetime.date.today().year
+    try:
+        year = int(input(f"Year (default {this_year}): ").strip() or this_year)
+    except ValueError:
+        print("❌ Error: Please enter a valid year")
+        return
+
+    print()
+    print(get_year_report(year))
+    path = input("Save as HTML to (leave blank to skip): ").strip()
+    if path:
+        with open(path, 'w', encoding='utf-8') as report_file:
+            report_file.write(get_year_report(year, 'html'))
+        print(f"✅ Report saved to {path}")
+
 def main():
     # Initialize database
     initialize_database()
@@ -191,13 +208,14 @@ def main():
     
     while True:
         display_main_menu()
-        choice = input("Enter your choice (1-14): ").strip()
+        choice = input("Enter your choice (1-16): ").strip()
         
         try:
             if choice == '1':
                 add_new_book()
             elif choice == '2':
-                view_all_books()
+                # Only the plain listings page; pick lists must stay on screen
+                view_all_books(use_pager=True)
             elif choice == '3':
                 find_book_by_id()
             elif choice == '4':
@@ -211,7 +229,7 @@ def main():
             elif choice == '8':
                 add_review_to_book()
             elif choice == '9':
-                view_all_reviews()
+                view_all_reviews(use_pager=True)
             elif choice == '10':
                 find_reviews_by_book()
             elif choice == '11':
@@ -221,6 +239,10 @@ def main():
             elif choice == '13':
                 view_reading_statistics()
             elif choice == '14':
+                view_review_analytics()
+            elif choice == '15':
+                view_year_report()
+            elif choice == '16':
                 print("Happy reading! 📖")
                 break
             else:
@@ -0,0 +1,14 @@
+from models import Book, initialize_database
+
+def dedupe_database():
+    """Merge duplicate books and reattach their reviews to the kept copy"""
+    initialize_database()
+
+    removed = Book.merge_duplicates()
+    if removed:
+        print(f"Merged {removed} duplicate book(s)")
+    else:
+        print("No duplicate books found")
+
+if __name__ == "__main__":
+    dedupe_database()
@@ -1,31 +1,240 @@
+import asyncio
+import functools
+import inspect
+import os
+import re
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Database connection
-CONN = sqlite3.connect('lib/db/book_tracker.db')
+DB_PATH = os.environ.get('BOOK_TRACKER_DB', 'lib/db/book_tracker.db')
+# Seconds any connection waits on another connection's lock (the async
+# writer, analytics workers) before failing with "database is locked"
+BUSY_TIMEOUT = 30
+CONN = sqlite3.connect(DB_PATH, timeout=BUSY_TIMEOUT)
 CURSOR = CONN.cursor()
 
-class Book:
+_NON_WORD = re.compile(r"[\W_]+")
+
+def normalize_key(title, author):
+    """Build the dedup key for a book: case-folded title and author with
+    punctuation and runs of whitespace collapsed to single spaces"""
+    def clean(value):
+        return " ".join(_NON_WORD.sub(" ", value.casefold()).split())
+    return f"{clean(title)}|{clean(author)}"
+
+def add_missing_columns(table, definitions):
+    """Bring tables created by older versions up to date with ALTER TABLE"""
+    existing = {row[1] for row in CURSOR.execute(f"PRAGMA table_info({table})")}
+    for name, definition in definitions.items():
+        if name not in existing:
+            CURSOR.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
+def track_changes(table):
+    """Install triggers that bump a per-table counter whenever rows change.
+
+    Caches compare table_versions() against the counters they were built
+    from instead of rescanning the data.
+    """
+    CURSOR.execute('''
+        CREATE TABLE IF NOT EXISTS table_changes (
+            name TEXT PRIMARY KEY,
+            changes INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    CURSOR.execute("INSERT OR IGNORE INTO table_changes (name) VALUES (?)", (table,))
+    columns = [row[1] for row in CURSOR.execute(f"PRAGMA table_info({table})")]
+    # Updates that leave every column as it was (e.g. re-upserting an
+    # unchanged row) don't count, so they keep caches valid
+    changed = " OR ".join(f"NEW.{column} IS NOT OLD.{column}" for column in columns)
+    for event, condition in (('INSERT', None), ('UPDATE', changed), ('DELETE', None)):
+        name = f"{table}_{event.lower()}_changes"
+        # Recreated so triggers from older versions pick up the WHEN guard
+        CURSOR.execute(f"DROP TRIGGER IF EXISTS {name}")
+        CURSOR.execute(f'''
+            CREATE TRIGGER {name}
+            AFTER {event} ON {table} {f"WHEN {condition}" if condition else ""}
+            BEGIN
+                UPDATE table_changes SET changes = changes + 1 WHERE name = '{table}';
+            END
+        ''')
+
+def table_versions(*tables):
+    """Current change counters for the given tables, in the same order"""
+    rows = dict(CURSOR.execute("SELECT name, changes FROM table_changes").fetchall())
+    return tuple(rows.get(table, 0) for table in tables)
+
+def _iter_rows(sql, params, batch_size=1000):
+    """Yield raw row tuples, fetching batch_size at a time"""
+    cursor = CONN.execute(sql, params)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from rows
+
+def _where(*conditions):
+    """WHERE clause and params from (sql, value) pairs, skipping None values"""
+    used = [(sql, value) for sql, value in conditions if value is not None]
+    if not used:
+        return "", ()
+    return "WHERE " + " AND ".join(sql for sql, _ in used), tuple(value for _, value in used)
+
+# Placeholder for a column left out of a projection; it is fetched on first access
+_DEFERRED = object()
+
+class Projection:
+    """Finder proxy that loads only some columns.
+
+    Book.only('title').find_by_id(1) behaves like Book.find_by_id(1) but
+    selects just id and title; any other column is queried when first read.
+    """
+    def __init__(self, model, columns):
+        self._model = model
+        self._columns = columns
+
+    def __getattr__(self, name):
+        finder = getattr(self._model, name)
+        if inspect.iscoroutinefunction(finder) or inspect.isasyncgenfunction(finder):
+            raise ValueError("Projections are not supported by the async API")
+        return functools.partial(finder, columns=self._columns)
+
+
+class Model:
+    """Shared query plumbing for Book and Review"""
+    TABLE = None
+    COLUMNS = ()
+
+    @classmethod
+    def only(cls, *columns):
+        """Project finders onto the given columns (id is always loaded)"""
+        unknown = set(columns) - set(cls.COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown {cls.TABLE} column(s): {sorted(unknown)}")
+        return Projection(cls, columns)
+
+    @classmethod
+    def defer(cls, *columns):
+        """Project finders onto every column except the given ones"""
+        unknown = set(columns) - set(cls.COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown {cls.TABLE} column(s): {sorted(unknown)}")
+        return Projection(cls, tuple(c for c in cls.COLUMNS if c not in columns))
+
+    @classmethod
+    def _select_sql(cls, columns, clause):
+        return f"SELECT {', '.join(('id',) + tuple(columns))} FROM {cls.TABLE} {clause}"
+
+    @classmethod
+    def _from_row(cls, row, columns):
+        # Rows come from our own tables, so they skip the setter validation
+        instance = cls.__new__(cls)
+        instance.id = row[0]
+        for name in cls.COLUMNS:
+            setattr(instance, f'_{name}', _DEFERRED)
+        for name, value in zip(columns, row[1:]):
+            setattr(instance, f'_{name}', value)
+        return instance
+
+    @classmethod
+    def _select(cls, clause, params, columns=None, conn=None):
+        columns = cls.COLUMNS if columns is None else columns
+        rows = (conn or CONN).execute(cls._select_sql(columns, clause), params).fetchall()
+        return [cls._from_row(row, columns) for row in rows]
+
+    @classmethod
+    def _iter_select(cls, clause, params, columns=None, batch_size=1000):
+        columns = cls.COLUMNS if columns is None else columns
+        for row in _iter_rows(cls._select_sql(columns, clause), params, batch_size):
+            yield cls._from_row(row, columns)
+
+    @classmethod
+    def save_many(cls, items, conn=None):
+        """Insert several new records in one transaction (all or nothing)"""
+        conn = conn or CONN
+        cursor = conn.cursor()
+        try:
+            new_ids = [item._insert(cursor) for item in items]
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        for item, new_id in zip(items, new_ids):
+            item.id = new_id
+        return items
+
+    # Async API - queries run on the shared AsyncExecutor, never on the event
+    # loop. Records are always fully loaded, since a deferred column would
+    # have to be fetched synchronously on first access.
+    @classmethod
+    async def afind_by_id(cls, record_id):
+        """Async find_by_id"""
+        records = await get_async_executor().read(cls._select, "WHERE id=?", (record_id,))
+        return records[0] if records else None
+
+    @classmethod
+    async def aiter_all(cls, batch_size=1000):
+        """Async iterator over every record, fetched a page at a time"""
+        last_id = 0
+        while True:
+            page = await get_async_executor().read(
+                cls._select, "WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size))
+            for record in page:
+                yield record
+            if len(page) < batch_size:
+                return
+            last_id = page[-1].id
+
+    @classmethod
+    async def asave_many(cls, items):
+        """Async save_many, queued behind any other pending writes"""
+        return await get_async_executor().write(cls.save_many, items)
+
+    def _get(self, name):
+        value = getattr(self, f'_{name}')
+        if value is _DEFERRED:
+            row = CURSOR.execute(
+                f"SELECT {name} FROM {self.TABLE} WHERE id=?", (self.id,)
+            ).fetchone()
+            value = row[0] if row else None
+            setattr(self, f'_{name}', value)
+        return value
+
+
+# Reading statuses in order of progress, used when merging duplicate copies
+STATUS_PROGRESS = {'want_to_read': 0, 'reading': 1, 'completed': 2}
+
+class Book(Model):
+    TABLE = 'books'
+    COLUMNS = ('title', 'author', 'genre', 'status')
+
     def __init__(self, title, author, genre=None, status="want_to_read", id=None):
         self.id = id
-        self.genre = genre
         self._reviews = []
         
         # Initialize private attributes first
         self._title = None
         self._author = None
+        self._genre = None
         self._status = None
         
         # Use property setters for validation
         self.title = title
         self.author = author
+        self.genre = genre
         self.status = status
 
     def __repr__(self):
         return f"<Book {self.id}: {self.title} by {self.author}>"
 
+    @property
+    def normalized_key(self):
+        return normalize_key(self.title, self.author)
+
     @property
     def title(self):
-        return self._title
+        return self._get('title')
 
     @title.setter
     def title(self, value):
@@ -37,7 +246,7 @@ class Book:
 
     @property
     def author(self):
-        return self._author
+        return self._get('author')
 
     @author.setter
     def author(self, value):
@@ -47,9 +256,17 @@ class Book:
             raise ValueError("Author name cannot exceed 50 characters")
         self._author = value.strip()
 
+    @property
+    def genre(self):
+        return self._get('genre')
+
+    @genre.setter
+    def genre(self, value):
+        self._genre = value
+
     @property
     def status(self):
-        return self._status
+        return self._get('status')
 
     @status.setter
     def status(self, value):
@@ -61,28 +278,70 @@ class Book:
     # ORM Methods
     def save(self):
         """Create a new book in the database"""
+        new_id = self._insert(CURSOR)
+        CONN.commit()
+        self.id = new_id
+        return self
+
+    def _insert(self, cursor):
         try:
-            CURSOR.execute('''
-                INSERT INTO books (title, author, genre, status)
-                VALUES (?, ?, ?, ?)
-            ''', (self.title, self.author, self.genre, self.status))
-            CONN.commit()
-            self.id = CURSOR.lastrowid
-            return self
-        except sqlite3.IntegrityError as e:
-            raise ValueError(f"Database error: {e}")
+            cursor.execute('''
+                INSERT INTO books (title, author, genre, status, normalized_key)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (self.title, self.author, self.genre, self.status, self.normalized_key))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"'{self.title}' by {self.author} already exists")
+        return cursor.lastrowid
+
+    # Columns an upsert may overwrite on an existing copy; a missing genre
+    # never clears a stored one
+    UPSERT_FIELDS = {
+        'genre': "genre=COALESCE(excluded.genre, books.genre)",
+        'status': "status=excluded.status",
+    }
+
+    def upsert(self, update=('genre',)):
+        """Insert the book, or update the given fields of the existing copy.
+
+        Status is left alone by default so re-importing a book never undoes
+        reading progress; pass update=() to leave existing copies untouched.
+        """
+        self._upsert_row(update)
+        CONN.commit()
+        return self
+
+    def _upsert_row(self, update):
+        unknown = set(update) - set(self.UPSERT_FIELDS)
+        if unknown:
+            raise ValueError(f"Cannot upsert field(s): {sorted(unknown)}")
+        if update:
+            conflict = "DO UPDATE SET " + ", ".join(self.UPSERT_FIELDS[field] for field in update)
+        else:
+            conflict = "DO NOTHING"
+        CURSOR.execute(f'''
+            INSERT INTO books (title, author, genre, status, normalized_key)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(normalized_key) {conflict}
+        ''', (self.title, self.author, self.genre, self.status, self.normalized_key))
+        row = CURSOR.execute("SELECT id FROM books WHERE normalized_key=?",
+                             (self.normalized_key,)).fetchone()
+        self.id = row[0]
 
     def update(self):
         """Update an existing book in the database"""
         if not self.id:
             raise ValueError("Book must have an ID to update")
         
-        CURSOR.execute('''
-            UPDATE books 
-            SET title=?, author=?, genre=?, status=?
-            WHERE id=?
-        ''', (self.title, self.author, self.genre, self.status, self.id))
-        CONN.commit()
+        try:
+            CURSOR.execute('''
+                UPDATE books 
+                SET title=?, author=?, genre=?, status=?, normalized_key=?
+                WHERE id=?
+            ''', (self.title, self.author, self.genre, self.status,
+                  self.normalized_key, self.id))
+            CONN.commit()
+        except sqlite3.IntegrityError:
+            raise ValueError(f"'{self.title}' by {self.author} already exists")
         return self
 
     def delete(self):
@@ -98,95 +357,174 @@ class Book:
     # Class Methods
     @classmethod
     def create_table(cls):
-        """Create the books table"""
+        """Create the books table and its unique dedup index"""
         CURSOR.execute('''
             CREATE TABLE IF NOT EXISTS books (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL,
                 author TEXT NOT NULL,
                 genre TEXT,
-                status TEXT DEFAULT 'want_to_read'
+                status TEXT DEFAULT 'want_to_read',
+                normalized_key TEXT,
+                added_at TEXT,
+                completed_at TEXT
             )
         ''')
+        add_missing_columns('books', {
+            'normalized_key': 'TEXT',
+            'added_at': 'TEXT',
+            'completed_at': 'TEXT',
+        })
+        cls._backfill_keys()
+        try:
+            CURSOR.execute('''
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_books_normalized_key
+                ON books (normalized_key)
+            ''')
+        except sqlite3.IntegrityError:
+            # Existing duplicates block the index; fold them together first
+            removed = cls.merge_duplicates()
+            print(f"Merged {removed} duplicate book(s) so titles can be kept unique "
+                  "(reviews were moved to the kept copy)")
+            CURSOR.execute('''
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_books_normalized_key
+                ON books (normalized_key)
+            ''')
+        # Timestamps are kept by triggers so every write path records them
+        CURSOR.execute('''
+            CREATE TRIGGER IF NOT EXISTS books_set_added_at
+            AFTER INSERT ON books WHEN NEW.added_at IS NULL
+            BEGIN
+                UPDATE books SET
+                    added_at = datetime('now', 'localtime'),
+                    completed_at = CASE WHEN NEW.status = 'completed'
+                                        THEN datetime('now', 'localtime') END
+                WHERE id = NEW.id;
+            END
+        ''')
+        CURSOR.execute('''
+            CREATE TRIGGER IF NOT EXISTS books_set_completed_at
+            AFTER UPDATE OF status ON books WHEN NEW.status IS NOT OLD.status
+            BEGIN
+                UPDATE books SET
+                    completed_at = CASE WHEN NEW.status = 'completed'
+                                        THEN datetime('now', 'localtime') END
+                WHERE id = NEW.id;
+            END
+        ''')
+        CURSOR.execute('''
+            CREATE INDEX IF NOT EXISTS idx_books_completed_at ON books (completed_at)
+        ''')
+        track_changes('books')
         CONN.commit()
 
     @classmethod
-    def get_all(cls):
-        """Get all books from the database"""
-        rows = CURSOR.execute("SELECT * FROM books").fetchall()
-        books = []
-        for row in rows:
-            book = cls(
-                id=row[0],
-                title=row[1],
-                author=row[2],
-                genre=row[3],
-                status=row[4]
-            )
-            books.append(book)
+    def _backfill_keys(cls):
+        rows = CURSOR.execute(
+            "SELECT id, title, author FROM books WHERE normalized_key IS NULL"
+        ).fetchall()
+        CURSOR.executemany(
+            "UPDATE books SET normalized_key=? WHERE id=?",
+            [(normalize_key(title, author), book_id) for book_id, title, author in rows]
+        )
+
+    @classmethod
+    def upsert_many(cls, books, update=('genre',)):
+        """Upsert several books in a single transaction (see upsert)"""
+        try:
+            for book in books:
+                book._upsert_row(update)
+            CONN.commit()
+        except Exception:
+            CONN.rollback()
+            raise
         return books
 
     @classmethod
-    def find_by_id(cls, book_id):
+    def merge_duplicates(cls):
+        """Fold books sharing a normalized key into the oldest copy.
+
+        The kept book takes the most advanced reading status and the first
+        genre found among the copies, and reviews of the removed copies are
+        reattached to it. Returns the number of rows removed.
+        """
+        cls._backfill_keys()
+        keys = [row[0] for row in CURSOR.execute('''
+            SELECT normalized_key FROM books
+            GROUP BY normalized_key HAVING COUNT(*) > 1
+        ''').fetchall()]
+        removed = 0
+        for key in keys:
+            copies = CURSOR.execute(
+                "SELECT id, status, genre, completed_at FROM books WHERE normalized_key=? ORDER BY id",
+                (key,)
+            ).fetchall()
+            keep_id = copies[0][0]
+            _, status, _, completed_at = max(copies, key=lambda copy: STATUS_PROGRESS.get(copy[1], 0))
+            genre = next((copy[2] for copy in copies if copy[2]), None)
+
+            CURSOR.execute("UPDATE books SET status=?, genre=? WHERE id=?", (status, genre, keep_id))
+            if completed_at:
+                # Separate statement so the status trigger doesn't restamp it
+                CURSOR.execute("UPDATE books SET completed_at=? WHERE id=?", (completed_at, keep_id))
+            CURSOR.execute('''
+                UPDATE reviews SET book_id=?
+                WHERE book_id IN (SELECT id FROM books WHERE normalized_key=? AND id<>?)
+            ''', (keep_id, key, keep_id))
+            CURSOR.execute("DELETE FROM books WHERE normalized_key=? AND id<>?", (key, keep_id))
+            removed += CURSOR.rowcount
+        CONN.commit()
+        return removed
+
+    @classmethod
+    def get_all(cls, columns=None):
+        """Get all books from the database"""
+        return cls._select("", (), columns)
+
+    @classmethod
+    def iter_all(cls, batch_size=1000, columns=None):
+        """Yield every book without loading the whole table at once"""
+        return cls._iter_select("ORDER BY id", (), columns, batch_size)
+
+    @classmethod
+    def listing_rows(cls, book_id=None, title=None, author=None, batch_size=1000):
+        """Stream (id, title, author, genre, review count, average rating, status)
+        tuples for listings, optionally filtered by id or partial title/author.
+
+        Review stats are aggregated per book in the same query (the join walks
+        idx_reviews_book_rating), so nothing is collected for the whole table.
+        """
+        clause, params = _where(("books.id = ?", book_id),
+                                ("books.title LIKE ?", None if title is None else f'%{title}%'),
+                                ("books.author LIKE ?", None if author is None else f'%{author}%'))
+        return _iter_rows(f'''
+            SELECT books.id, books.title, books.author, books.genre,
+                   COUNT(reviews.id), AVG(reviews.rating), books.status
+            FROM books LEFT JOIN reviews ON reviews.book_id = books.id
+            {clause}
+            GROUP BY books.id ORDER BY books.id
+        ''', params, batch_size)
+
+    @classmethod
+    def find_by_id(cls, book_id, columns=None):
         """Find a book by ID"""
-        row = CURSOR.execute("SELECT * FROM books WHERE id=?", (book_id,)).fetchone()
-        if row:
-            return cls(
-                id=row[0],
-                title=row[1],
-                author=row[2],
-                genre=row[3],
-                status=row[4]
-            )
-        return None
+        books = cls._select("WHERE id=?", (book_id,), columns)
+        return books[0] if books else None
 
     @classmethod
-    def find_by_title(cls, title):
+    def find_by_title(cls, title, columns=None):
         """Find books by title (partial match)"""
-        rows = CURSOR.execute("SELECT * FROM books WHERE title LIKE ?", (f'%{title}%',)).fetchall()
-        books = []
-        for row in rows:
-            book = cls(
-                id=row[0],
-                title=row[1],
-                author=row[2],
-                genre=row[3],
-                status=row[4]
-            )
-            books.append(book)
-        return books
+        return cls._select("WHERE title LIKE ?", (f'%{title}%',), columns)
 
     @classmethod
-    def find_by_author(cls, author):
+    def find_by_author(cls, author, columns=None):
         """Find books by author (partial match)"""
-        rows = CURSOR.execute("SELECT * FROM books WHERE author LIKE ?", (f'%{author}%',)).fetchall()
-        books = []
-        for row in rows:
-            book = cls(
-                id=row[0],
-                title=row[1],
-                author=row[2],
-                genre=row[3],
-                status=row[4]
-            )
-            books.append(book)
-        return books
+        return cls._select("WHERE author LIKE ?", (f'%{author}%',), columns)
 
     @classmethod
-    def find_by_status(cls, status):
+    def find_by_status(cls, status, columns=None):
         """Find books by reading status"""
-        rows = CURSOR.execute("SELECT * FROM books WHERE status=?", (status,)).fetchall()
-        books = []
-        for row in rows:
-            book = cls(
-                id=row[0],
-                title=row[1],
-                author=row[2],
-                genre=row[3],
-                status=row[4]
-            )
-            books.append(book)
-        return books
+        return cls._select("WHERE status=?", (status,), columns)
 
     # Relationship Methods - FIXED: Removed circular imports
     def reviews(self):
@@ -201,7 +539,10 @@ class Book:
         return review.save()
 
 
-class Review:
+class Review(Model):
+    TABLE = 'reviews'
+    COLUMNS = ('content', 'rating', 'book_id')
+
     def __init__(self, content, rating, book_id, id=None):
         self.id = id
         # Initialize private attributes first
@@ -219,7 +560,7 @@ class Review:
 
     @property
     def content(self):
-        return self._content
+        return self._get('content')
 
     @content.setter
     def content(self, value):
@@ -231,7 +572,7 @@ class Review:
 
     @property
     def rating(self):
-        return self._rating
+        return self._get('rating')
 
     @rating.setter
     def rating(self, value):
@@ -241,7 +582,7 @@ class Review:
 
     @property
     def book_id(self):
-        return self._book_id
+        return self._get('book_id')
 
     @book_id.setter
     def book_id(self, value):
@@ -252,16 +593,20 @@ class Review:
     # ORM Methods
     def save(self):
         """Create a new review in the database"""
+        new_id = self._insert(CURSOR)
+        CONN.commit()
+        self.id = new_id
+        return self
+
+    def _insert(self, cursor):
         try:
-            CURSOR.execute('''
+            cursor.execute('''
                 INSERT INTO reviews (content, rating, book_id)
                 VALUES (?, ?, ?)
             ''', (self.content, self.rating, self.book_id))
-            CONN.commit()
-            self.id = CURSOR.lastrowid
-            return self
         except sqlite3.IntegrityError as e:
             raise ValueError(f"Database error: {e}")
+        return cursor.lastrowid
 
     def update(self):
         """Update an existing review in the database"""
@@ -294,71 +639,142 @@ class Review:
                 content TEXT NOT NULL,
                 rating INTEGER NOT NULL,
                 book_id INTEGER NOT NULL,
+                created_at TEXT,
                 FOREIGN KEY (book_id) REFERENCES books(id) ON DELETE CASCADE
             )
         ''')
+        add_missing_columns('reviews', {'created_at': 'TEXT'})
+        CURSOR.execute('''
+            CREATE TRIGGER IF NOT EXISTS reviews_set_created_at
+            AFTER INSERT ON reviews WHEN NEW.created_at IS NULL
+            BEGIN
+                UPDATE reviews SET created_at = datetime('now', 'localtime')
+                WHERE id = NEW.id;
+            END
+        ''')
+        CURSOR.execute('''
+            CREATE INDEX IF NOT EXISTS idx_reviews_created_at ON reviews (created_at)
+        ''')
+        track_changes('reviews')
+        # Covers per-book lookups and the review stats in Book.listing_rows
+        CURSOR.execute('''
+            CREATE INDEX IF NOT EXISTS idx_reviews_book_rating
+            ON reviews (book_id, rating)
+        ''')
         CONN.commit()
 
     @classmethod
-    def get_all(cls):
+    def get_all(cls, columns=None):
         """Get all reviews from the database"""
-        rows = CURSOR.execute("SELECT * FROM reviews").fetchall()
-        reviews = []
-        for row in rows:
-            review = cls(
-                id=row[0],
-                content=row[1],
-                rating=row[2],
-                book_id=row[3]
-            )
-            reviews.append(review)
-        return reviews
+        return cls._select("", (), columns)
+
+    @classmethod
+    def iter_all(cls, batch_size=1000, columns=None):
+        """Yield every review without loading the whole table at once"""
+        return cls._iter_select("ORDER BY id", (), columns, batch_size)
+
+    @classmethod
+    def listing_rows(cls, book_id=None, rating=None, batch_size=1000):
+        """Stream (id, rating, book title, content) tuples for listings,
+        optionally filtered by book or rating; the title is None for orphans.
+        """
+        clause, params = _where(("reviews.book_id = ?", book_id), ("reviews.rating = ?", rating))
+        return _iter_rows(f'''
+            SELECT reviews.id, reviews.rating, books.title, reviews.content
+            FROM reviews LEFT JOIN books ON books.id = reviews.book_id
+            {clause}
+            ORDER BY reviews.id
+        ''', params, batch_size)
 
     @classmethod
-    def find_by_id(cls, review_id):
+    def find_by_id(cls, review_id, columns=None):
         """Find a review by ID"""
-        row = CURSOR.execute("SELECT * FROM reviews WHERE id=?", (review_id,)).fetchone()
-        if row:
-            return cls(
-                id=row[0],
-                content=row[1],
-                rating=row[2],
-                book_id=row[3]
-            )
-        return None
+        reviews = cls._select("WHERE id=?", (review_id,), columns)
+        return reviews[0] if reviews else None
 
     @classmethod
-    def find_by_book_id(cls, book_id):
+    def find_by_book_id(cls, book_id, columns=None):
         """Find all reviews for a specific book"""
-        rows = CURSOR.execute("SELECT * FROM reviews WHERE book_id=?", (book_id,)).fetchall()
-        reviews = []
-        for row in rows:
-            review = cls(
-                id=row[0],
-                content=row[1],
-                rating=row[2],
-                book_id=row[3]
-            )
-            reviews.append(review)
-        return reviews
+        return cls._select("WHERE book_id=?", (book_id,), columns)
 
     @classmethod
-    def find_by_rating(cls, rating):
+    def find_by_rating(cls, rating, columns=None):
         """Find reviews by rating"""
-        rows = CURSOR.execute("SELECT * FROM reviews WHERE rating=?", (rating,)).fetchall()
-        reviews = []
-        for row in rows:
-            review = cls(
-                id=row[0],
-                content=row[1],
-                rating=row[2],
-                book_id=row[3]
-            )
-            reviews.append(review)
-        return reviews
+        return cls._select("WHERE rating=?", (rating,), columns)
+
+
+class AsyncExecutor:
+    """Runs ORM calls off the event loop.
+
+    Reads go to a bounded thread pool where each worker owns its own
+    connection, so concurrent reads overlap (sqlite3 releases the GIL while
+    a query runs). Writes go to a single writer thread, which serialises them
+    in submission order and avoids lock contention between writers.
+    """
+    def __init__(self, max_readers=4, path=DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._readers = ThreadPoolExecutor(max_readers, thread_name_prefix='book-tracker-read')
+        self._writer = ThreadPoolExecutor(1, thread_name_prefix='book-tracker-write')
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Only ever used by this thread; check_same_thread=False lets shutdown() close it
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _call(self, func, args):
+        return func(*args, conn=self._connection())
+
+    async def read(self, func, *args):
+        """Await func(*args, conn=<worker connection>) on the reader pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, self._call, func, args)
+
+    async def write(self, func, *args):
+        """Await func(*args, conn=<writer connection>) on the writer thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._writer, self._call, func, args)
+
+    def shutdown(self):
+        """Wait for queued work, then close every worker connection"""
+        self._readers.shutdown(wait=True)
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
+_async_executor = None
+
+def get_async_executor():
+    """The process-wide AsyncExecutor, created on first use"""
+    global _async_executor
+    if _async_executor is None:
+        _async_executor = AsyncExecutor()
+    return _async_executor
+
+def configure_async(max_readers=4):
+    """Replace the shared AsyncExecutor, e.g. to change the reader pool size"""
+    global _async_executor
+    if _async_executor is not None:
+        _async_executor.shutdown()
+    _async_executor = AsyncExecutor(max_readers)
+    return _async_executor
 
 
 # Initialize database tables
 def initialize_database():
-    Book.create_table()
-    Review.create_table()
\ No newline at end of file
+    # WAL lets readers proceed while a writer holds its lock. The mode is
+    # stored in the database file, so this deliberately converts it once;
+    # SQLite keeps -wal and -shm files next to it while it is open.
+    CONN.execute("PRAGMA journal_mode=WAL")
+    Review.create_table()
+    Book.create_table()
\ No newline at end of file
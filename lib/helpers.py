@@ -1,4 +1,7 @@
+import itertools
+
 from db.models import Book, Review
+from render import output_stream, render_table
 
 def display_main_menu():
     print("\n" + "="*50)
@@ -20,45 +23,74 @@ def display_main_menu():
     print("12. Delete Review")
     print("\nSTATISTICS")
     print("13. View Reading Statistics")
-    print("14. Exit")
+    print("14. Review Analytics")
+    print("15. Year in Books Report")
+    print("16. Exit")
     print("="*50)
 
-def display_books(books, title="BOOKS"):
-    if not books:
-        print(f"No {title.lower()} found.")
-        return
-    
-    print(f"\n📖 {title} ({len(books)} found)")
-    print("-" * 60)
-    for book in books:
-        status_icons = {
-            'want_to_read': '📚',
-            'reading': '🔖', 
-            'completed': '✅'
-        }
-        print(f"{book.id}. {status_icons[book.status]} {book.title} by {book.author}")
-        print(f"   Genre: {book.genre or 'Not specified'} | Status: {book.status.replace('_', ' ').title()}")
-        
-        # Show reviews for this book
-        reviews = book.reviews()
-        if reviews:
-            avg_rating = sum(review.rating for review in reviews) / len(reviews)
-            print(f"   Reviews: {len(reviews)} | Avg Rating: {avg_rating:.1f} ⭐")
-        print()
+STATUS_ICONS = {
+    'want_to_read': '📚',
+    'reading': '🔖',
+    'completed': '✅'
+}
+
+STATUS_LABELS = {status: f"{icon} {status.replace('_', ' ').title()}"
+                 for status, icon in STATUS_ICONS.items()}
+
+# Free-text and emoji cells go in the trailing unpadded column so every other
+# cell stays ASCII and takes render's fast path
+BOOK_COLUMNS = [
+    ('ID', 6, '>'),
+    ('Title', 32, '<'),
+    ('Author', 22, '<'),
+    ('Genre', 16, '<'),
+    ('Reviews', 7, '>'),
+    ('Avg', 5, '>'),
+    ('Status', None, '<'),
+]
 
-def display_reviews(reviews, title="REVIEWS"):
-    if not reviews:
+REVIEW_COLUMNS = [
+    ('ID', 6, '>'),
+    ('Rating', 6, '<'),
+    ('Book', 32, '<'),
+    ('Review', None, '<'),
+]
+
+def _peek(items):
+    """Return (first item, iterator over all items) without losing the first"""
+    iterator = iter(items)
+    first = next(iterator, None)
+    if first is None:
+        return None, iterator
+    return first, itertools.chain([first], iterator)
+
+def _render_listing(rows, columns, icon, title, width, use_pager):
+    first, rows = _peek(rows)
+    if first is None:
         print(f"No {title.lower()} found.")
         return
-    
-    print(f"\n📝 {title} ({len(reviews)} found)")
-    print("-" * 50)
-    for review in reviews:
-        book = Book.find_by_id(review.book_id)
-        book_title = book.title if book else "Unknown Book"
-        print(f"{review.id}. ⭐ {review.rating}/5 - {book_title}")
-        print(f"   {review.content}")
-        print()
+
+    with output_stream(use_pager) as out:
+        out.write(f"\n{icon} {title}\n" + "-" * width + "\n")
+        shown = render_table(rows, columns, out)
+        out.write(f"\n{shown} found\n")
+
+def display_books(rows, title="BOOKS", use_pager=False):
+    """Render Book.listing_rows() tuples as a table, streaming them from the cursor"""
+    book_rows = (
+        (book_id, book_title, author, genre or 'Not specified', count or '',
+         f"{avg_rating:.1f}" if avg_rating else '', STATUS_LABELS.get(status, status))
+        for book_id, book_title, author, genre, count, avg_rating, status in rows
+    )
+    _render_listing(book_rows, BOOK_COLUMNS, '📖', title, 60, use_pager)
+
+def display_reviews(rows, title="REVIEWS", use_pager=False):
+    """Render Review.listing_rows() tuples as a table, streaming them from the cursor"""
+    review_rows = (
+        (review_id, f"{rating}/5", book_title or "Unknown Book", content)
+        for review_id, rating, book_title, content in rows
+    )
+    _render_listing(review_rows, REVIEW_COLUMNS, '📝', title, 50, use_pager)
 
 def get_valid_rating():
     """Get a valid rating from user input"""
@@ -77,7 +109,7 @@ def get_valid_book_id():
     while True:
         try:
             book_id = int(input("Enter book ID: "))
-            book = Book.find_by_id(book_id)
+            book = Book.only().find_by_id(book_id)
             if book:
                 return book_id
             else:
@@ -90,7 +122,7 @@ def get_valid_review_id():
     while True:
         try:
             review_id = int(input("Enter review ID: "))
-            review = Review.find_by_id(review_id)
+            review = Review.only().find_by_id(review_id)
             if review:
                 return review_id
             else:
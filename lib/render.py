@@ -0,0 +1,119 @@
+import itertools
+import os
+import subprocess
+import sys
+import unicodedata
+from contextlib import contextmanager
+from functools import lru_cache
+
+# Rows are joined and written in batches so a large listing costs one
+# write per batch instead of several print() calls per row
+ROWS_PER_WRITE = 500
+
+
+@lru_cache(maxsize=4096)
+def display_width(text):
+    """Terminal cell width of text (wide characters such as emoji take two)"""
+    if text.isascii():
+        return len(text)
+    return sum(2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+               for char in text)
+
+
+def fit(text, width, align='<'):
+    """Pad or truncate text to exactly width terminal cells"""
+    text = str(text)
+    if width is None:
+        return text
+    if text.isascii():
+        text = text[:width]
+        return text.rjust(width) if align == '>' else text.ljust(width)
+    while display_width(text) > width:
+        text = text[:-1]
+    padding = ' ' * (width - display_width(text))
+    return padding + text if align == '>' else text + padding
+
+
+def format_row(values, columns):
+    """Format one row; columns is a list of (header, width, align) tuples.
+
+    A width of None leaves the cell unpadded, which suits free-text trailing columns.
+    """
+    return '  '.join(fit(value, width, align)
+                     for value, (_, width, align) in zip(values, columns)).rstrip()
+
+
+def row_formatter(columns):
+    """Return a fast format_row equivalent for one column layout.
+
+    The layout is compiled into a single %-format string (cheaper per call
+    than str.format, and values are never parsed as templates). Padding by character
+    count is only right when the fixed-width cells are ASCII, so rows whose
+    fixed-width prefix is not fall back to format_row. Unpadded columns must
+    come last, which lets them hold emoji or other wide text for free.
+    """
+    fields = []
+    prefix_length = 0
+    for _, width, align in columns:
+        if width is None:
+            fields.append("%s")
+        else:
+            fields.append(f"%{'' if align == '>' else '-'}{width}.{width}s")
+            prefix_length += width + 2
+    template = '  '.join(fields)
+
+    def format_fast(values):
+        line = template % values
+        if line[:prefix_length].isascii():
+            return line.rstrip()
+        return format_row(values, columns)
+    return format_fast
+
+
+@contextmanager
+def output_stream(use_pager=False):
+    """Yield a stream for listing output, piped through $PAGER when requested.
+
+    The pager is only used when stdout is a terminal and $PAGER is set, so
+    piping the CLI into another program still gets plain output.
+    """
+    pager = os.environ.get('PAGER')
+    if not (use_pager and pager and sys.stdout.isatty()):
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+
+    process = subprocess.Popen(pager, shell=True, stdin=subprocess.PIPE,
+                               encoding='utf-8', errors='replace')
+    try:
+        yield process.stdin
+        process.stdin.close()
+    except BrokenPipeError:
+        # The user quit the pager before the listing finished; drop whatever
+        # is still buffered so closing stdin can't raise again later
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+    finally:
+        process.wait()
+
+
+def render_table(rows, columns, out):
+    """Stream rows (an iterable of value tuples) to out as aligned columns.
+
+    Rows are consumed lazily, so the whole result set never has to be held
+    in memory. Returns the number of rows written.
+    """
+    header = format_row([name for name, _, _ in columns], columns)
+    out.write(header + '\n' + '-' * display_width(header) + '\n')
+
+    format_fast = row_formatter(columns)
+    count = 0
+    rows = iter(rows)
+    while True:
+        batch = [format_fast(values) for values in itertools.islice(rows, ROWS_PER_WRITE)]
+        if not batch:
+            return count
+        out.write('\n'.join(batch) + '\n')
+        count += len(batch)
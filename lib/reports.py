@@ -0,0 +1,173 @@
+import calendar
+import datetime
+import html
+
+from db.models import CONN, CURSOR, initialize_database, table_versions
+
+TOP_N = 5
+
+
+def create_tables():
+    """Create the rendered-report cache"""
+    CURSOR.execute('''
+        CREATE TABLE IF NOT EXISTS report_cache (
+            year INTEGER NOT NULL,
+            format TEXT NOT NULL,
+            version TEXT NOT NULL,
+            body TEXT NOT NULL,
+            PRIMARY KEY (year, format)
+        )
+    ''')
+    CONN.commit()
+
+
+def _year_bounds(year):
+    return f"{year:04d}-01-01", f"{year + 1:04d}-01-01"
+
+
+def build_year_report(year):
+    """Collect the "year in books" figures with a handful of aggregate queries.
+
+    Everything is grouped and counted in SQLite, so no book or review rows
+    are materialised in Python no matter how large the library is.
+    """
+    start, end = _year_bounds(year)
+    completed_in_year = "FROM books WHERE completed_at >= ? AND completed_at < ?"
+    reviewed_in_year = "FROM reviews WHERE created_at >= ? AND created_at < ?"
+    bounds = (start, end)
+
+    completed = CURSOR.execute(f"SELECT COUNT(*) {completed_in_year}", bounds).fetchone()[0]
+    review_count, avg_rating = CURSOR.execute(
+        f"SELECT COUNT(*), AVG(rating) {reviewed_in_year}", bounds
+    ).fetchone()
+    ratings = dict(CURSOR.execute(
+        f"SELECT rating, COUNT(*) {reviewed_in_year} GROUP BY rating", bounds
+    ).fetchall())
+    top_genres = CURSOR.execute(f'''
+        SELECT COALESCE(genre, 'Not specified'), COUNT(*) {completed_in_year}
+        GROUP BY 1 ORDER BY 2 DESC, 1 LIMIT ?
+    ''', bounds + (TOP_N,)).fetchall()
+    top_authors = CURSOR.execute(f'''
+        SELECT author, COUNT(*) {completed_in_year}
+        GROUP BY author ORDER BY 2 DESC, author LIMIT ?
+    ''', bounds + (TOP_N,)).fetchall()
+    most_reviewed = CURSOR.execute('''
+        SELECT books.title, COUNT(*)
+        FROM reviews JOIN books ON books.id = reviews.book_id
+        WHERE reviews.created_at >= ? AND reviews.created_at < ?
+        GROUP BY reviews.book_id ORDER BY 2 DESC, books.title LIMIT ?
+    ''', bounds + (TOP_N,)).fetchall()
+    completed_by_month = dict(CURSOR.execute(
+        f"SELECT CAST(strftime('%m', completed_at) AS INTEGER), COUNT(*) {completed_in_year} GROUP BY 1",
+        bounds
+    ).fetchall())
+    reviews_by_month = dict(CURSOR.execute(
+        f"SELECT CAST(strftime('%m', created_at) AS INTEGER), COUNT(*) {reviewed_in_year} GROUP BY 1",
+        bounds
+    ).fetchall())
+
+    return {
+        'year': year,
+        'completed': completed,
+        'reviews': review_count,
+        'average_rating': avg_rating,
+        'rating_distribution': [(rating, ratings.get(rating, 0)) for rating in range(5, 0, -1)],
+        'top_genres': top_genres,
+        'top_authors': top_authors,
+        'most_reviewed': most_reviewed,
+        'months': [(calendar.month_abbr[month], completed_by_month.get(month, 0),
+                    reviews_by_month.get(month, 0)) for month in range(1, 13)],
+    }
+
+
+def render_markdown(report):
+    """Render a report dict as Markdown"""
+    lines = [f"# {report['year']} in Books", ""]
+    lines.append(f"- Books completed: {report['completed']}")
+    lines.append(f"- Reviews written: {report['reviews']}")
+    if report['average_rating']:
+        lines.append(f"- Average rating: {report['average_rating']:.1f} ⭐")
+
+    lines += ["", "## Rating distribution", "", "| Rating | Reviews |", "| --- | ---: |"]
+    lines += [f"| {'⭐' * rating} | {count} |" for rating, count in report['rating_distribution']]
+
+    for heading, rows in (("Top genres", report['top_genres']),
+                          ("Top authors", report['top_authors']),
+                          ("Most reviewed", report['most_reviewed'])):
+        lines += ["", f"## {heading}", ""]
+        lines += [f"{rank}. {name} ({count})" for rank, (name, count) in enumerate(rows, 1)]
+        if not rows:
+            lines.append("_Nothing yet._")
+
+    lines += ["", "## By month", "", "| Month | Completed | Reviews |", "| --- | ---: | ---: |"]
+    lines += [f"| {month} | {completed} | {reviews} |"
+              for month, completed, reviews in report['months']]
+    return "\n".join(lines) + "\n"
+
+
+def render_html(report):
+    """Render a report dict as a standalone HTML page"""
+    def table(headers, rows):
+        head = "".join(f"<th>{html.escape(str(cell))}</th>" for cell in headers)
+        body = "".join("<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + "</tr>"
+                       for row in rows)
+        return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+    def ranking(rows):
+        if not rows:
+            return "<p><em>Nothing yet.</em></p>"
+        items = "".join(f"<li>{html.escape(str(name))} ({count})</li>" for name, count in rows)
+        return f"<ol>{items}</ol>"
+
+    title = f"{report['year']} in Books"
+    summary = [f"<li>Books completed: {report['completed']}</li>",
+               f"<li>Reviews written: {report['reviews']}</li>"]
+    if report['average_rating']:
+        summary.append(f"<li>Average rating: {report['average_rating']:.1f}</li>")
+
+    return "\n".join([
+        "<!DOCTYPE html>",
+        f"<html><head><meta charset=\"utf-8\"><title>{title}</title></head><body>",
+        f"<h1>{title}</h1>",
+        f"<ul>{''.join(summary)}</ul>",
+        "<h2>Rating distribution</h2>",
+        table(("Rating", "Reviews"), report['rating_distribution']),
+        "<h2>Top genres</h2>", ranking(report['top_genres']),
+        "<h2>Top authors</h2>", ranking(report['top_authors']),
+        "<h2>Most reviewed</h2>", ranking(report['most_reviewed']),
+        "<h2>By month</h2>",
+        table(("Month", "Completed", "Reviews"), report['months']),
+        "</body></html>",
+    ]) + "\n"
+
+
+RENDERERS = {
+    'markdown': render_markdown,
+    'html': render_html,
+}
+
+
+def get_year_report(year, fmt='markdown'):
+    """Return the rendered report, rebuilding it only if books/reviews changed"""
+    if fmt not in RENDERERS:
+        raise ValueError(f"Format must be one of: {list(RENDERERS)}")
+    create_tables()
+    version = ":".join(str(changes) for changes in table_versions('books', 'reviews'))
+    row = CURSOR.execute(
+        "SELECT version, body FROM report_cache WHERE year=? AND format=?", (year, fmt)
+    ).fetchone()
+    if row and row[0] == version:
+        return row[1]
+
+    body = RENDERERS[fmt](build_year_report(year))
+    CURSOR.execute('''
+        INSERT INTO report_cache (year, format, version, body) VALUES (?, ?, ?, ?)
+        ON CONFLICT(year, format) DO UPDATE SET version = excluded.version, body = excluded.body
+    ''', (year, fmt, version, body))
+    CONN.commit()
+    return body
+
+
+if __name__ == "__main__":
+    initialize_database()
+    print(get_year_report(datetime.date.today().year))
@@ -0,0 +1,300 @@
+import os
+import re
+import sqlite3
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from db.models import BUSY_TIMEOUT, CONN, CURSOR, DB_PATH, initialize_database
+
+FETCH_SIZE = 5000
+TOP_TERMS = 10
+
+TOKEN_PATTERN = re.compile(r"[a-z']+")
+
+STOP_WORDS = frozenset("""
+    a an and are as at be but by for from has have he her his i in is it its
+    me my of on or she so that the their them they this to was were with you
+""".split())
+
+POSITIVE_WORDS = frozenset("""
+    amazing beautiful best brilliant captivating compelling delightful enjoyed
+    excellent fantastic fascinating favorite fun good great gripping insightful
+    inspiring love loved masterpiece moving perfect powerful recommend superb
+    thoughtful wonderful
+""".split())
+
+NEGATIVE_WORDS = frozenset("""
+    awful bad boring confusing disappointing dull hate hated mediocre messy
+    overrated poor pointless predictable slow tedious terrible unreadable weak
+    worst
+""".split())
+
+
+def tokenize(text):
+    """Split review text into lowercase word tokens, dropping stop words"""
+    tokens = (token.strip("'") for token in TOKEN_PATTERN.findall(text.lower()))
+    return [token for token in tokens if token and token not in STOP_WORDS]
+
+
+def sentiment_score(tokens):
+    """Lexicon score in [-1, 1]: (positive - negative) / sentiment words"""
+    positive = sum(1 for token in tokens if token in POSITIVE_WORDS)
+    negative = sum(1 for token in tokens if token in NEGATIVE_WORDS)
+    if positive + negative == 0:
+        return 0.0
+    return (positive - negative) / (positive + negative)
+
+
+def analyse_rows(rows, terms, sentiment):
+    """Fold (book_id, genre, rating, content) rows into running aggregates.
+
+    terms maps (scope, value) to a Counter of terms; sentiment maps book_id
+    to [reviews, summed score].
+    """
+    for book_id, genre, rating, content in rows:
+        tokens = tokenize(content)
+        for scope in (('book', str(book_id)), ('genre', genre or 'Unknown'),
+                      ('rating', str(rating))):
+            counter = terms.get(scope)
+            if counter is None:
+                counter = terms[scope] = Counter()
+            # Counting a token list runs in C; merging a mapping would not
+            counter.update(tokens)
+        totals = sentiment.setdefault(book_id, [0, 0.0])
+        totals[0] += 1
+        totals[1] += sentiment_score(tokens)
+
+
+def analyse_partition(path, after_id, up_to_id, partitions, partition, fetch_size=FETCH_SIZE):
+    """Worker entry point: analyse new reviews of the books in one partition.
+
+    Books are split by book_id modulo partitions, so the per-book counters
+    of different workers never overlap and the parent only merges the small
+    genre and rating scopes. Each worker reads reviews with
+    after_id < id <= up_to_id on its own connection, so review text is never
+    read or pickled by the parent.
+    """
+    terms = {}
+    sentiment = {}
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT)
+    try:
+        cursor = conn.execute('''
+            SELECT reviews.book_id, books.genre, reviews.rating, reviews.content
+            FROM reviews LEFT JOIN books ON books.id = reviews.book_id
+            WHERE reviews.id > ? AND reviews.id <= ? AND reviews.book_id % ? = ?
+        ''', (after_id, up_to_id, partitions, partition))
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                break
+            analyse_rows(rows, terms, sentiment)
+    finally:
+        conn.close()
+    return terms, sentiment
+
+
+def create_tables():
+    """Create the analytics summary tables"""
+    row = CURSOR.execute(
+        "SELECT sql FROM sqlite_master WHERE type='table' AND name='review_term_counts'"
+    ).fetchone()
+    # Earlier versions used a rowid table, which stores every term twice
+    # (table and key index); the counts are rebuilt into the new layout
+    migrate = bool(row) and 'WITHOUT ROWID' not in row[0].upper()
+    if migrate:
+        CURSOR.execute("DROP TABLE review_term_counts")
+    CURSOR.execute('''
+        CREATE TABLE IF NOT EXISTS review_term_counts (
+            scope TEXT NOT NULL,
+            scope_value TEXT NOT NULL,
+            term TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (scope, scope_value, term)
+        ) WITHOUT ROWID
+    ''')
+    CURSOR.execute('''
+        CREATE TABLE IF NOT EXISTS book_review_sentiment (
+            book_id INTEGER PRIMARY KEY,
+            reviews INTEGER NOT NULL,
+            score_total REAL NOT NULL
+        )
+    ''')
+    CURSOR.execute('''
+        CREATE TABLE IF NOT EXISTS analytics_state (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        )
+    ''')
+    if CURSOR.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='review_sentiment'"
+    ).fetchone():
+        # Per-review sentiment from earlier versions; rebuild into per-book totals
+        CURSOR.execute("DROP TABLE review_sentiment")
+        migrate = True
+    if migrate:
+        CURSOR.execute("INSERT OR REPLACE INTO analytics_state (name, value) VALUES ('stale', 1)")
+    # Incremental runs only see new review ids, so any change that alters
+    # already-analysed reviews marks the summaries stale for a rebuild.
+    # UPDATE OF fires whenever a column is in the SET list, so the WHEN
+    # guards keep status changes and no-op upserts from forcing a rebuild.
+    triggers = {
+        'reviews_delete': ('DELETE ON reviews', '1'),
+        'reviews_update': ('UPDATE OF content, rating, book_id ON reviews',
+                           'NEW.content IS NOT OLD.content OR NEW.rating IS NOT OLD.rating '
+                           'OR NEW.book_id IS NOT OLD.book_id'),
+        'books_genre_update': ('UPDATE OF genre ON books', 'NEW.genre IS NOT OLD.genre'),
+    }
+    for name, (event, condition) in triggers.items():
+        # Recreated so databases holding the unguarded versions pick up the WHEN
+        CURSOR.execute(f"DROP TRIGGER IF EXISTS analytics_stale_on_{name}")
+        CURSOR.execute(f'''
+            CREATE TRIGGER analytics_stale_on_{name}
+            AFTER {event} WHEN {condition}
+            BEGIN
+                INSERT OR REPLACE INTO analytics_state (name, value) VALUES ('stale', 1);
+            END
+        ''')
+    CONN.commit()
+
+
+def _is_stale():
+    row = CURSOR.execute("SELECT value FROM analytics_state WHERE name='stale'").fetchone()
+    return bool(row and row[0])
+
+
+def _last_review_id():
+    row = CURSOR.execute(
+        "SELECT value FROM analytics_state WHERE name='last_review_id'"
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def _merge(into, terms, sentiment):
+    merged_terms, merged_sentiment = into
+    for scope, counts in terms.items():
+        counter = merged_terms.get(scope)
+        if counter is None:
+            # Always the case for book scopes, which are partitioned by worker
+            merged_terms[scope] = counts
+        else:
+            counter.update(counts)
+    # Sentiment is keyed by book, so partitions never collide
+    merged_sentiment.update(sentiment)
+
+
+def _store(terms, sentiment, empty=False):
+    # Into freshly emptied tables plain inserts skip the conflict lookups
+    term_conflict = "" if empty else \
+        "ON CONFLICT(scope, scope_value, term) DO UPDATE SET count = count + excluded.count"
+    sentiment_conflict = "" if empty else '''ON CONFLICT(book_id) DO UPDATE SET
+            reviews = reviews + excluded.reviews,
+            score_total = score_total + excluded.score_total'''
+    CURSOR.executemany(f'''
+        INSERT INTO review_term_counts (scope, scope_value, term, count)
+        VALUES (?, ?, ?, ?) {term_conflict}
+    ''', ((scope, value, term, count)
+          for (scope, value), counts in terms.items()
+          for term, count in counts.items()))
+    CURSOR.executemany(f'''
+        INSERT INTO book_review_sentiment (book_id, reviews, score_total)
+        VALUES (?, ?, ?) {sentiment_conflict}
+    ''', ((book_id, reviews, score_total)
+          for book_id, (reviews, score_total) in sentiment.items()))
+
+
+def refresh_analytics(full=False, workers=None, fetch_size=FETCH_SIZE):
+    """Analyse reviews added since the last run and fold them into the summaries.
+
+    Each worker process reads and aggregates the new reviews of its own
+    partition of books (see analyse_partition), the parent merges the
+    partial results, and the merged totals are written once. The
+    summaries are rebuilt from scratch with full=True, or automatically when
+    reviews were edited or deleted (or a genre changed) since the last run.
+    The write is a single transaction that is rolled back on error.
+    Returns (reviews analysed, whether the summaries were rebuilt).
+    """
+    create_tables()
+    rebuilt = full or _is_stale()
+    workers = workers or os.cpu_count() or 1
+    last_id = 0 if rebuilt else _last_review_id()
+    max_id = CURSOR.execute("SELECT COALESCE(MAX(id), 0) FROM reviews").fetchone()[0]
+    # Release the read snapshot so workers and later writes see a fresh view
+    CONN.commit()
+
+    merged = ({}, {})
+    if max_id > last_id:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(analyse_partition, DB_PATH, last_id, max_id,
+                                   workers, partition, fetch_size)
+                       for partition in range(workers)]
+            for future in as_completed(futures):
+                _merge(merged, *future.result())
+    analysed = sum(reviews for reviews, _ in merged[1].values())
+
+    try:
+        if rebuilt:
+            CURSOR.execute("DELETE FROM review_term_counts")
+            CURSOR.execute("DELETE FROM book_review_sentiment")
+            CURSOR.execute("DELETE FROM analytics_state")
+        _store(*merged, empty=rebuilt)
+        CURSOR.execute('''
+            INSERT INTO analytics_state (name, value) VALUES ('last_review_id', ?)
+            ON CONFLICT(name) DO UPDATE SET value = excluded.value
+        ''', (max(max_id, last_id),))
+        CONN.commit()
+    except BaseException:
+        # Never leave partial counts behind for the next commit to pick up
+        CONN.rollback()
+        raise
+    return analysed, rebuilt
+
+
+def top_terms(scope, scope_value, limit=TOP_TERMS):
+    """Most frequent terms for a book id, genre or rating"""
+    return CURSOR.execute('''
+        SELECT term, count FROM review_term_counts
+        WHERE scope=? AND scope_value=?
+        ORDER BY count DESC, term
+        LIMIT ?
+    ''', (scope, str(scope_value), limit)).fetchall()
+
+
+def book_sentiment():
+    """Average sentiment per book as (title, reviews, average score) rows"""
+    return CURSOR.execute('''
+        SELECT books.title, sentiment.reviews, sentiment.score_total / sentiment.reviews
+        FROM book_review_sentiment AS sentiment JOIN books ON books.id = sentiment.book_id
+        ORDER BY 3 DESC
+    ''').fetchall()
+
+
+def display_analytics(full=False):
+    """Refresh the summaries and print sentiment and top terms"""
+    analysed, rebuilt = refresh_analytics(full)
+    print("\n🧮 REVIEW ANALYTICS")
+    print("=" * 30)
+    if rebuilt:
+        print(f"Summaries rebuilt from {analysed} reviews")
+    else:
+        print(f"Newly analysed reviews: {analysed}")
+
+    rows = book_sentiment()
+    if not rows:
+        print("No reviews analysed yet.")
+        return
+
+    print("\nSentiment by book (-1 negative, +1 positive):")
+    for title, count, score in rows:
+        print(f"  {score:+.2f}  {title} ({count} reviews)")
+
+    print("\nTop terms by rating:")
+    for rating in range(5, 0, -1):
+        terms = top_terms('rating', rating, 5)
+        if terms:
+            print(f"  {rating}⭐: " + ", ".join(f"{term} ({count})" for term, count in terms))
+
+
+if __name__ == "__main__":
+    initialize_database()
+    display_analytics(full='--full' in sys.argv)
@@ -1,24 +1,26 @@
-from lib.database import create_tables
-from lib.cli import main_menu
+import os
+import sys
+
+# The CLI modules import each other as top-level modules from lib/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lib'))
+
+from db.models import Book, initialize_database
+from cli import main
 
 def seed_sample_data():
     """Add some sample books for testing"""
-    from lib.models.book import Book
-    
     sample_books = [
-        Book("The Great Gatsby", "F. Scott Fitzgerald", "Classic", "completed", 5, "American classic"),
-        Book("Dune", "Frank Herbert", "Science Fiction", "reading", 4),
+        Book("The Great Gatsby", "F. Scott Fitzgerald", "Classic", "completed"),
+        Book("Dune", "Frank Herbert", "Science Fiction", "reading"),
         Book("Project Hail Mary", "Andy Weir", "Science Fiction", "want_to_read"),
     ]
     
+    # Existing copies are left untouched so re-seeding never resets progress
+    Book.upsert_many(sample_books, update=())
     for book in sample_books:
-        try:
-            book.save()
-            print(f"Added sample book: {book.title}")
-        except Exception as e:
-            print(f"Note: {book.title} may already exist in database")
+        print(f"Sample book ready: {book.title} (ID {book.id})")
 
 if __name__ == "__main__":
-    create_tables()     # Set up the database
-    seed_sample_data()  # Add sample data
-    main_menu()         # Launch the CLI
\ No newline at end of file
+    initialize_database()  # Set up the database
+    seed_sample_data()     # Add sample data
+    main()                 # Launch the CLI
\ No newline at end of file
@@ -0,0 +1,24 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# models.py connects at import time, so point it at a scratch database first
+os.environ['BOOK_TRACKER_DB'] = os.path.join(tempfile.mkdtemp(), 'test_book_tracker.db')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+from db.models import CONN, initialize_database
+
+
+@pytest.fixture(autouse=True)
+def db():
+    """Fresh, empty tables for every test"""
+    initialize_database()
+    yield CONN
+    CONN.rollback()
+    tables = [row[0] for row in CONN.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")]
+    for table in tables:
+        CONN.execute(f"DELETE FROM {table}")
+    CONN.commit()
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from db.models import CONN, Book, Review, configure_async
+
+
+@pytest.fixture(autouse=True)
+def executor():
+    executor = configure_async(max_readers=2)
+    yield executor
+    executor.shutdown()
+
+
+def test_database_is_in_wal_mode_for_every_connection(executor):
+    def journal_mode(conn):
+        return conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert journal_mode(CONN) == 'wal'
+    assert asyncio.run(executor.read(journal_mode)) == 'wal'
+
+
+def test_afind_by_id_loads_every_column():
+    book = Book("Dune", "Frank Herbert", "Science Fiction", "reading").save()
+
+    found = asyncio.run(Book.afind_by_id(book.id))
+
+    assert (found.title, found.author, found.genre, found.status) == \
+        ("Dune", "Frank Herbert", "Science Fiction", "reading")
+    assert asyncio.run(Book.afind_by_id(book.id + 1)) is None
+
+
+def test_aiter_all_pages_through_every_record():
+    book = Book("Dune", "Frank Herbert").save()
+    Review.save_many([Review(f"Review {i}", 4, book.id) for i in range(25)])
+
+    async def collect():
+        return [review.content async for review in Review.aiter_all(batch_size=10)]
+
+    assert asyncio.run(collect()) == [f"Review {i}" for i in range(25)]
+
+
+def test_asave_many_assigns_ids():
+    books = asyncio.run(Book.asave_many([Book("Dune", "Frank Herbert"), Book("Emma", "Jane Austen")]))
+
+    assert all(book.id for book in books)
+    assert sorted(book.title for book in Book.get_all()) == ["Dune", "Emma"]
+
+
+def test_asave_many_rolls_back_on_duplicate():
+    Book("Dune", "Frank Herbert").save()
+    batch = [Book("Emma", "Jane Austen"), Book("DUNE!", "frank herbert")]
+
+    with pytest.raises(ValueError):
+        asyncio.run(Book.asave_many(batch))
+
+    assert [book.title for book in Book.get_all()] == ["Dune"]
+    assert batch[0].id is None
+
+
+def test_projections_are_rejected_by_async_api():
+    with pytest.raises(ValueError):
+        Book.only('title').afind_by_id
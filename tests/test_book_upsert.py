@@ -0,0 +1,72 @@
+import pytest
+
+from db.models import Book, Review, normalize_key
+
+
+def test_normalize_key_ignores_case_punctuation_and_spacing():
+    assert normalize_key("Dune!", "Frank  Herbert") == normalize_key("dune", "frank herbert")
+
+
+def test_save_rejects_duplicate():
+    Book("Dune", "Frank Herbert").save()
+    with pytest.raises(ValueError):
+        Book("DUNE", "frank herbert").save()
+
+
+def test_upsert_is_idempotent_and_keeps_status():
+    book = Book("Dune", "Frank Herbert", "Science Fiction", "reading").upsert()
+    book.status = 'completed'
+    book.update()
+
+    again = Book("dune", "frank herbert").upsert()
+
+    assert again.id == book.id
+    assert len(Book.get_all()) == 1
+    stored = Book.find_by_id(book.id)
+    assert stored.status == 'completed'
+    assert stored.genre == 'Science Fiction'
+
+
+def test_upsert_many_without_update_leaves_existing_rows_alone():
+    Book("Dune", "Frank Herbert", "Science Fiction", "completed").save()
+
+    Book.upsert_many([Book("Dune", "Frank Herbert", "Classic", "reading"),
+                      Book("Emma", "Jane Austen")], update=())
+    Book.upsert_many([Book("Dune", "Frank Herbert", "Classic", "reading")], update=())
+
+    books = {book.title: book for book in Book.get_all()}
+    assert len(books) == 2
+    assert books["Dune"].status == 'completed'
+    assert books["Dune"].genre == 'Science Fiction'
+
+
+def test_upsert_can_update_status_when_asked():
+    book = Book("Dune", "Frank Herbert", status="reading").save()
+    Book("Dune", "Frank Herbert", status="completed").upsert(update=('status',))
+    assert Book.find_by_id(book.id).status == 'completed'
+
+
+def _insert_duplicate(db, title, author, status, genre=None):
+    # Duplicates can only exist in databases created before the unique index
+    cursor = db.execute("INSERT INTO books (title, author, status, genre) VALUES (?, ?, ?, ?)",
+                        (title, author, status, genre))
+    return cursor.lastrowid
+
+
+def test_merge_duplicates_reattaches_reviews_and_keeps_progress(db):
+    db.execute("DROP INDEX idx_books_normalized_key")
+    kept = _insert_duplicate(db, "Dune", "Frank Herbert", "want_to_read")
+    copy = _insert_duplicate(db, "dune!", "frank herbert", "completed", "Science Fiction")
+    db.commit()
+    Review("Epic world building", 5, kept).save()
+    Review("Still great", 4, copy).save()
+
+    assert Book.merge_duplicates() == 1
+
+    books = Book.get_all()
+    assert [book.id for book in books] == [kept]
+    assert books[0].status == 'completed'
+    assert books[0].genre == 'Science Fiction'
+    completed_at = db.execute("SELECT completed_at FROM books WHERE id=?", (kept,)).fetchone()[0]
+    assert completed_at is not None
+    assert sorted(review.book_id for review in Review.get_all()) == [kept, kept]
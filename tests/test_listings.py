@@ -0,0 +1,66 @@
+import io
+
+from db.models import CONN, Book, Review
+from helpers import BOOK_COLUMNS, REVIEW_COLUMNS, display_books
+from render import format_row, render_table, row_formatter
+
+
+def test_book_listing_rows_aggregate_reviews():
+    dune = Book("Dune", "Frank Herbert", "Science Fiction", "reading").save()
+    emma = Book("Emma", "Jane Austen").save()
+    Review("Epic", 5, dune.id).save()
+    Review("Slow start", 2, dune.id).save()
+
+    assert list(Book.listing_rows()) == [
+        (dune.id, "Dune", "Frank Herbert", "Science Fiction", 2, 3.5, "reading"),
+        (emma.id, "Emma", "Jane Austen", None, 0, None, "want_to_read"),
+    ]
+    assert [row[0] for row in Book.listing_rows(author="austen")] == [emma.id]
+    assert [row[0] for row in Book.listing_rows(title="un", book_id=dune.id)] == [dune.id]
+
+
+def test_review_listing_rows_join_titles():
+    dune = Book("Dune", "Frank Herbert").save()
+    review = Review("Epic", 5, dune.id).save()
+    CONN.execute("INSERT INTO reviews (content, rating, book_id) VALUES ('Lost', 3, 999)")
+    CONN.commit()
+
+    rows = list(Review.listing_rows())
+    assert rows[0] == (review.id, 5, "Dune", "Epic")
+    assert rows[1][1:] == (3, None, "Lost")
+    assert [row[0] for row in Review.listing_rows(book_id=dune.id, rating=5)] == [review.id]
+    assert list(Review.listing_rows(rating=1)) == []
+
+
+def test_row_formatter_matches_format_row():
+    rows = [
+        (1, "Dune", "Frank Herbert", "Science Fiction", 2, "3.5", "🔖 Reading"),
+        (22, "A" * 40, "Author", "Not specified", "", "", "✅ Completed"),
+        (3, "東京物語", "Ozu", "Drama", 1, "5.0", "📚 Want To Read"),
+    ]
+    format_fast = row_formatter(BOOK_COLUMNS)
+    for row in rows:
+        assert format_fast(row) == format_row(row, BOOK_COLUMNS)
+    # Wide characters fall back to padding by terminal width
+    assert format_fast(rows[2]).index("Ozu") == format_fast(rows[0]).index("Frank") - 4
+
+
+def test_render_table_streams_and_counts():
+    out = io.StringIO()
+    shown = render_table(((i, "5/5", f"Book {i}", "Fine") for i in range(1203)), REVIEW_COLUMNS, out)
+
+    lines = out.getvalue().splitlines()
+    assert shown == 1203
+    assert len(lines) == 1205
+    assert lines[-1] == format_row((1202, "5/5", "Book 1202", "Fine"), REVIEW_COLUMNS)
+
+
+def test_display_books_fills_defaults(capsys):
+    Book("Emma", "Jane Austen").save()
+
+    display_books(Book.listing_rows())
+
+    output = capsys.readouterr().out
+    assert "Not specified" in output
+    assert "📚 Want To Read" in output
+    assert "1 found" in output
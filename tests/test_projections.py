@@ -0,0 +1,46 @@
+import pytest
+
+from db.models import _DEFERRED, Book, Review
+
+
+@pytest.fixture
+def review():
+    book = Book("Dune", "Frank Herbert", "Science Fiction", "reading").save()
+    return Review("Epic world building", 5, book.id).save()
+
+
+def test_only_leaves_other_columns_deferred(review):
+    loaded = Review.only('rating', 'book_id').find_by_id(review.id)
+
+    assert loaded.rating == 5
+    assert loaded.book_id == review.book_id
+    assert loaded._content is _DEFERRED
+
+
+def test_deferred_column_loads_on_first_access(review):
+    loaded = Review.only('rating').get_all()[0]
+
+    assert loaded.content == "Epic world building"
+    assert loaded._content == "Epic world building"
+
+
+def test_defer_excludes_named_columns(review):
+    book = Book.defer('genre').find_by_id(review.book_id)
+
+    assert book._genre is _DEFERRED
+    assert book.title == "Dune"
+    assert book.genre == "Science Fiction"
+
+
+def test_update_after_projection_writes_every_column(review):
+    book = Book.only('status').find_by_id(review.book_id)
+    book.status = 'completed'
+    book.update()
+
+    stored = Book.find_by_id(review.book_id)
+    assert (stored.title, stored.genre, stored.status) == ("Dune", "Science Fiction", "completed")
+
+
+def test_only_rejects_unknown_columns():
+    with pytest.raises(ValueError):
+        Review.only('stars')
@@ -0,0 +1,91 @@
+import reports
+from db.models import CONN, Book, Review, table_versions
+
+
+def _completed_at(book):
+    return CONN.execute("SELECT completed_at FROM books WHERE id=?", (book.id,)).fetchone()[0]
+
+
+def _tamper_cache(year):
+    CONN.execute("UPDATE report_cache SET body='cached' WHERE year=?", (year,))
+    CONN.commit()
+
+
+def test_cached_report_is_returned_while_counters_are_unchanged():
+    Book("Dune", "Frank Herbert", status="completed").save()
+    reports.get_year_report(2023)
+    _tamper_cache(2023)
+
+    assert reports.get_year_report(2023) == "cached"
+    assert reports.get_year_report(2023, 'html') != "cached"
+
+
+def test_book_and_review_writes_invalidate_cache():
+    book = Book("Dune", "Frank Herbert").save()
+    reports.get_year_report(2023)
+    _tamper_cache(2023)
+
+    book.status = 'completed'
+    book.update()
+    assert reports.get_year_report(2023).startswith("# 2023 in Books")
+
+    _tamper_cache(2023)
+    Review("Epic", 5, book.id).save()
+    assert reports.get_year_report(2023) != "cached"
+
+
+def test_noop_writes_leave_versions_alone():
+    book = Book("Dune", "Frank Herbert", "Science Fiction", "reading").save()
+    review = Review("Epic", 5, book.id).save()
+    versions = table_versions('books', 'reviews')
+
+    Book("dune", "frank herbert", "Science Fiction").upsert()
+    Book.upsert_many([Book("Dune", "Frank Herbert")], update=())
+    book.update()
+    review.update()
+    assert table_versions('books', 'reviews') == versions
+
+    review.rating = 4
+    review.update()
+    assert table_versions('books', 'reviews') == (versions[0], versions[1] + 1)
+
+
+def test_completed_at_follows_status():
+    finished = Book("Dune", "Frank Herbert", status="completed").save()
+    reading = Book("Emma", "Jane Austen", status="reading").save()
+    assert _completed_at(finished) is not None
+    assert _completed_at(reading) is None
+
+    reading.status = 'completed'
+    reading.update()
+    assert _completed_at(reading) is not None
+
+    reading.status = 'reading'
+    reading.update()
+    assert _completed_at(reading) is None
+
+
+def test_year_report_buckets_by_year_and_month():
+    books = [Book(f"Book {i}", "Author", "Fantasy", "completed").save() for i in range(5)]
+    stamps = ["2022-12-31 23:59:59", "2023-01-01 00:00:00", "2023-03-15 10:00:00",
+              "2023-03-31 23:59:59", "2024-01-01 00:00:00"]
+    for book, stamp in zip(books, stamps):
+        CONN.execute("UPDATE books SET completed_at=? WHERE id=?", (stamp, book.id))
+    for rating, stamp in ((5, "2023-03-02 09:00:00"), (3, "2023-12-31 20:00:00"),
+                          (1, "2024-02-01 09:00:00")):
+        CONN.execute("INSERT INTO reviews (content, rating, book_id, created_at) VALUES (?, ?, ?, ?)",
+                     ("Fine", rating, books[2].id, stamp))
+    CONN.commit()
+
+    report = reports.build_year_report(2023)
+
+    assert report['completed'] == 3
+    assert report['reviews'] == 2
+    assert report['average_rating'] == 4.0
+    assert report['rating_distribution'] == [(5, 1), (4, 0), (3, 1), (2, 0), (1, 0)]
+    months = {month: (completed, reviews) for month, completed, reviews in report['months']}
+    assert months['Jan'] == (1, 0)
+    assert months['Mar'] == (2, 1)
+    assert months['Dec'] == (0, 1)
+    assert sum(completed for completed, _ in months.values()) == 3
+    assert report['most_reviewed'] == [("Book 2", 2)]
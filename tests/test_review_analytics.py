@@ -0,0 +1,113 @@
+import pytest
+
+import review_analytics
+from db.models import CONN, Book, Review
+
+
+def _term_count(term, scope='rating', value='5'):
+    row = CONN.execute(
+        "SELECT count FROM review_term_counts WHERE scope=? AND scope_value=? AND term=?",
+        (scope, value, term)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def _add_reviews(book, count, content="great plot"):
+    for _ in range(count):
+        Review(content, 5, book.id).save()
+
+
+def test_tokenize_and_sentiment():
+    tokens = review_analytics.tokenize("The plot was GREAT, but the ending was boring")
+    assert tokens == ['plot', 'great', 'ending', 'boring']
+    assert review_analytics.sentiment_score(tokens) == 0.0
+    assert review_analytics.sentiment_score(['great', 'plot']) == 1.0
+
+
+def test_refresh_is_incremental():
+    book = Book("Dune", "Frank Herbert", "Science Fiction").save()
+    _add_reviews(book, 30)
+
+    assert review_analytics.refresh_analytics(workers=3, fetch_size=7) == (30, False)
+    assert _term_count('great') == 30
+    assert review_analytics.refresh_analytics(workers=1) == (0, False)
+
+    _add_reviews(book, 5)
+    assert review_analytics.refresh_analytics(workers=1) == (5, False)
+    assert _term_count('great') == 35
+    assert _term_count('great', 'genre', 'Science Fiction') == 35
+
+
+def test_partitioned_refresh_matches_single_worker():
+    books = [Book(f"Book {i}", "Author", "Fantasy" if i % 2 else "Horror").save()
+             for i in range(5)]
+    for i, book in enumerate(books):
+        _add_reviews(book, i + 1, "slow but moving" if i % 2 else "great plot")
+
+    def snapshot():
+        return CONN.execute("SELECT * FROM review_term_counts ORDER BY 1, 2, 3").fetchall()
+
+    review_analytics.refresh_analytics(full=True, workers=1)
+    single = snapshot(), review_analytics.book_sentiment()
+    review_analytics.refresh_analytics(full=True, workers=3, fetch_size=2)
+    assert (snapshot(), review_analytics.book_sentiment()) == single
+    assert _term_count('plot', 'genre', 'Horror') == 1 + 3 + 5
+
+
+def test_failed_refresh_rolls_back(monkeypatch):
+    book = Book("Dune", "Frank Herbert").save()
+    _add_reviews(book, 100)
+    real_store = review_analytics._store
+
+    def failing_store(terms, sentiment, empty=False):
+        real_store(terms, sentiment, empty)
+        raise RuntimeError("injected failure")
+
+    monkeypatch.setattr(review_analytics, '_store', failing_store)
+    with pytest.raises(RuntimeError):
+        review_analytics.refresh_analytics(workers=2, fetch_size=10)
+    # Any later commit must not persist the partial counts
+    CONN.commit()
+    assert _term_count('great') == 0
+
+    monkeypatch.setattr(review_analytics, '_store', real_store)
+    assert review_analytics.refresh_analytics(workers=2, fetch_size=10) == (100, False)
+    assert _term_count('great') == 100
+
+
+def test_deleted_review_triggers_rebuild():
+    book = Book("Dune", "Frank Herbert").save()
+    _add_reviews(book, 3)
+    review_analytics.refresh_analytics(workers=1)
+
+    Review.get_all()[0].delete()
+
+    assert review_analytics.refresh_analytics(workers=1) == (2, True)
+    assert _term_count('great') == 2
+    assert review_analytics.book_sentiment() == [("Dune", 2, 1.0)]
+
+
+def test_status_update_and_noop_upsert_stay_incremental():
+    book = Book("Dune", "Frank Herbert", "Science Fiction", "reading").save()
+    _add_reviews(book, 3)
+    assert review_analytics.refresh_analytics(workers=1) == (3, False)
+
+    book.status = 'completed'
+    book.update()
+    Book("Dune", "Frank Herbert", "Science Fiction").upsert()
+    _add_reviews(book, 1)
+
+    assert review_analytics.refresh_analytics(workers=1) == (1, False)
+
+
+def test_genre_change_triggers_rebuild():
+    book = Book("Dune", "Frank Herbert", "Science Fiction").save()
+    _add_reviews(book, 2)
+    review_analytics.refresh_analytics(workers=1)
+
+    book.genre = "Classic"
+    book.update()
+
+    assert review_analytics.refresh_analytics(workers=1) == (2, True)
+    assert _term_count('great', 'genre', 'Classic') == 2
+    assert _term_count('great', 'genre', 'Science Fiction') == 0